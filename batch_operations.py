@@ -0,0 +1,298 @@
+# batch_operations.py
+try:
+    import FreeCAD as App
+    import Part
+except ImportError:
+    raise ImportError("This script must be run within FreeCAD")
+
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+import heapq
+import os
+import time
+
+# Operation specs are plain dicts, e.g.
+#   {'name': 'Rounded', 'operation': 'Fillet', 'sources': ['Box'], 'radius': 1.0}
+#   {'name': 'Pushed', 'operation': 'Extrude', 'sources': ['Face'], 'vector': (0, 0, 5)}
+# A source is either an object already in the document or the name of another
+# spec in the same batch, which makes that spec a dependency.
+
+
+def _fillet(shapes, spec):
+    shape = shapes[0]
+    return shape.makeFillet(spec['radius'], shape.Edges)
+
+def _chamfer(shapes, spec):
+    shape = shapes[0]
+    return shape.makeChamfer(spec['size'], shape.Edges)
+
+def _extrude(shapes, spec):
+    return shapes[0].extrude(App.Vector(*spec['vector']))
+
+def _union(shapes, spec):
+    return shapes[0].fuse(shapes[1:])
+
+def _difference(shapes, spec):
+    return shapes[0].cut(shapes[1:])
+
+def _intersection(shapes, spec):
+    return shapes[0].common(shapes[1:])
+
+def _compound(shapes, spec):
+    return Part.makeCompound(shapes)
+
+OPERATION_MAP = {
+    'Boolean Union': _union,
+    'Boolean Difference': _difference,
+    'Boolean Intersection': _intersection,
+    'Compound': _compound,
+    'Extrude': _extrude,
+    'Chamfer': _chamfer,
+    'Fillet': _fillet
+}
+
+# Required spec keys and (min, max) source counts; None means unbounded
+OPERATION_RULES = {
+    'Boolean Union': ((), (2, None)),
+    'Boolean Difference': ((), (2, None)),
+    'Boolean Intersection': ((), (2, None)),
+    'Compound': ((), (1, None)),
+    'Extrude': (('vector',), (1, 1)),
+    'Chamfer': (('size',), (1, 1)),
+    'Fillet': (('radius',), (1, 1))
+}
+
+def _validate_spec(spec):
+    missing = [key for key in ('name', 'operation') if key not in spec]
+    if missing:
+        raise ValueError(f"Operation spec {spec.get('name', spec)} is missing: "
+                         f"{', '.join(missing)}")
+    name = spec['name']
+    operation = spec['operation']
+    if operation not in OPERATION_MAP:
+        raise ValueError(f"Unsupported batch operation: {operation}")
+
+    required, (min_sources, max_sources) = OPERATION_RULES[operation]
+    missing = [key for key in required if key not in spec]
+    if missing:
+        raise ValueError(f"{operation} operation {name} is missing: {', '.join(missing)}")
+
+    sources = spec.get('sources', [])
+    if not isinstance(sources, (list, tuple)):
+        raise ValueError(f"Sources for operation {name} must be a list, "
+                         f"got {type(sources).__name__}")
+    count = len(sources)
+    if count < min_sources or (max_sources is not None and count > max_sources):
+        if max_sources is None:
+            expected = f"at least {min_sources}"
+        elif min_sources == max_sources:
+            expected = f"exactly {min_sources}"
+        else:
+            expected = f"{min_sources} to {max_sources}"
+        raise ValueError(f"{operation} operation {name} needs {expected} "
+                         f"source(s), got {count}")
+
+def build_dependency_graph(doc, specs):
+    """Validate specs and return (spec by name, dependencies, dependents, order)
+
+    `order` is a topological order that follows the spec list wherever the
+    dependencies allow it, so results can be added deterministically.
+    """
+    by_name = {}
+    for spec in specs:
+        _validate_spec(spec)
+        if spec['name'] in by_name:
+            raise ValueError(f"Duplicate operation name: {spec['name']}")
+        if doc.getObject(spec['name']) is not None:
+            raise ValueError(f"Operation name {spec['name']} is already used "
+                             f"by an object in the document")
+        by_name[spec['name']] = spec
+
+    depends_on = {name: set() for name in by_name}
+    dependents = {name: set() for name in by_name}
+    for name, spec in by_name.items():
+        for source in spec['sources']:
+            if source in by_name:
+                depends_on[name].add(source)
+                dependents[source].add(name)
+                continue
+            obj = doc.getObject(source)
+            if obj is None:
+                raise ValueError(f"Unknown source '{source}' for operation {name}")
+            if getattr(obj, 'Shape', None) is None:
+                raise ValueError(f"Source '{source}' for operation {name} has no shape")
+
+    # Kahn's algorithm, picking ready specs in list order
+    position = {name: i for i, name in enumerate(by_name)}
+    remaining = {name: len(deps) for name, deps in depends_on.items()}
+    ready = [(position[name], name) for name, count in remaining.items() if count == 0]
+    heapq.heapify(ready)
+    order = []
+    while ready:
+        _, name = heapq.heappop(ready)
+        order.append(name)
+        for child in dependents[name]:
+            remaining[child] -= 1
+            if remaining[child] == 0:
+                heapq.heappush(ready, (position[child], child))
+    if len(order) != len(by_name):
+        raise ValueError("Operation specs contain a dependency cycle")
+
+    return by_name, depends_on, dependents, order
+
+def run_batch_operations(specs, doc=None, max_workers=1):
+    """Run operation specs as a dependency DAG and add results in one transaction.
+
+    Every job gets its own copies of its input shapes, taken on the calling
+    thread, so no shape is shared between workers. The document is only read
+    before scheduling and written after all work is done. Runs serially by
+    default; see benchmark_batch_operations() before raising `max_workers`.
+    A failing operation does not stop the batch: its error is recorded and
+    everything depending on it is skipped.
+    """
+    doc = doc or App.ActiveDocument
+    if doc is None:
+        raise ValueError("No document to run batch operations in")
+    by_name, depends_on, dependents, order = build_dependency_graph(doc, specs)
+
+    results = {}
+    failed = {}
+    skipped = {}
+    snapshots = {}
+    remaining = {name: len(deps) for name, deps in depends_on.items()}
+
+    def skip_dependents(name, reason):
+        pending = deque(dependents[name])
+        while pending:
+            child = pending.popleft()
+            if child not in skipped and child not in failed:
+                skipped[child] = reason
+                pending.extend(dependents[child])
+
+    # Snapshot document shapes per spec so one bad source only fails its spec
+    for name in order:
+        try:
+            snapshots[name] = {
+                source: doc.getObject(source).Shape.copy()
+                for source in by_name[name]['sources'] if source not in by_name
+            }
+        except Exception as e:
+            failed[name] = f"Could not read source shape: {e}"
+
+    for name in failed:
+        skip_dependents(name, f"Depends on failed operation {name}")
+
+    def inputs_for(name):
+        spec = by_name[name]
+        return [results[s].copy() if s in by_name else snapshots[name][s]
+                for s in spec['sources']]
+
+    def compute(spec, inputs):
+        return OPERATION_MAP[spec['operation']](inputs, spec)
+
+    def submit(pool, running, name):
+        if name in failed or name in skipped:
+            return
+        try:
+            inputs = inputs_for(name)
+        except Exception as e:
+            failed[name] = f"Could not copy input shapes: {e}"
+            skip_dependents(name, f"Depends on failed operation {name}")
+            return
+        running[pool.submit(compute, by_name[name], inputs)] = name
+
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        running = {}
+        for name in order:
+            if remaining[name] == 0:
+                submit(pool, running, name)
+
+        while running:
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                name = running.pop(future)
+                try:
+                    shape = future.result()
+                    if shape.isNull():
+                        raise ValueError("Operation produced an empty shape")
+                except Exception as e:
+                    failed[name] = str(e)
+                    skip_dependents(name, f"Depends on failed operation {name}")
+                    continue
+
+                results[name] = shape
+                for child in dependents[name]:
+                    remaining[child] -= 1
+                    if remaining[child] == 0:
+                        submit(pool, running, child)
+
+    created = {}
+    doc.openTransaction("Batch operations")
+    for name in order:
+        if name not in results or name in skipped:
+            continue
+        feature = None
+        try:
+            feature = doc.addObject("Part::Feature", name)
+            feature.Label = name
+            feature.Shape = results[name]
+        except Exception as e:
+            if feature is not None:
+                doc.removeObject(feature.Name)
+            failed[name] = f"Could not add result to document: {e}"
+            skip_dependents(name, f"Depends on failed operation {name}")
+            continue
+        created[name] = feature
+    doc.commitTransaction()
+    doc.recompute()
+
+    return {
+        'created': created,
+        'failed': failed,
+        'skipped': skipped
+    }
+
+def benchmark_batch_operations(count=1000, max_workers=None):
+    """Fillet `count` generated boxes serially and pooled, and report both
+
+    Each mode gets its own freshly generated document so neither run sees
+    the other's features; the documents are closed afterwards.
+    """
+    pooled_workers = max_workers or os.cpu_count() or 1
+
+    timings = {}
+    for label, workers in (('serial', 1), ('pooled', pooled_workers)):
+        doc = App.newDocument(f"BatchBenchmark{label.capitalize()}")
+        try:
+            specs = []
+            for i in range(count):
+                box = doc.addObject("Part::Box", f"Box{i}")
+                box.Length = 10.0
+                box.Width = 10.0
+                box.Height = 10.0
+                box.Placement = App.Placement(App.Vector(15.0 * i, 0, 0), App.Rotation())
+                specs.append({
+                    'name': f"Fillet{i}",
+                    'operation': 'Fillet',
+                    'sources': [box.Name],
+                    'radius': 1.0
+                })
+            doc.recompute()
+
+            start = time.perf_counter()
+            report = run_batch_operations(specs, doc=doc, max_workers=workers)
+            elapsed = time.perf_counter() - start
+        finally:
+            App.closeDocument(doc.Name)
+        timings[label] = (elapsed, report)
+
+        print(f"{label} ({workers} worker(s)): {count} fillets in {elapsed:.2f}s "
+              f"({count / elapsed:.1f} ops/s), "
+              f"{len(report['failed'])} failed, {len(report['skipped'])} skipped")
+
+    speedup = timings['serial'][0] / timings['pooled'][0]
+    print(f"pooled speedup over serial: {speedup:.2f}x")
+    return timings
+
+if __name__ == "__main__":
+    benchmark_batch_operations()
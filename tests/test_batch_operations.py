@@ -0,0 +1,254 @@
+import os
+import sys
+import types
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+class FakeShape:
+    def __init__(self, label, fail=False):
+        self.label = label
+        self.fail = fail
+        self.Edges = []
+
+    def copy(self):
+        return FakeShape(self.label, self.fail)
+
+    def isNull(self):
+        return False
+
+    def _derive(self, operation, *others):
+        if self.fail:
+            raise RuntimeError(f"{operation} failed on {self.label}")
+        return FakeShape(f"{operation}({self.label})")
+
+    def makeFillet(self, radius, edges):
+        return self._derive("fillet")
+
+    def makeChamfer(self, size, edges):
+        return self._derive("chamfer")
+
+    def extrude(self, vector):
+        return self._derive("extrude")
+
+    def fuse(self, others):
+        return self._derive("fuse", *others)
+
+    def cut(self, others):
+        return self._derive("cut", *others)
+
+    def common(self, others):
+        return self._derive("common", *others)
+
+
+class FakeObject:
+    def __init__(self, name, shape=None):
+        self.Name = name
+        if shape is not None:
+            self.Shape = shape
+
+
+class FakeDocument:
+    def __init__(self, objects=()):
+        self.objects = {obj.Name: obj for obj in objects}
+        self.added = []
+        self.transactions = []
+
+    def getObject(self, name):
+        return self.objects.get(name)
+
+    def addObject(self, type_name, name):
+        obj = FakeObject(name)
+        self.objects[name] = obj
+        self.added.append(name)
+        return obj
+
+    def removeObject(self, name):
+        del self.objects[name]
+        self.added.remove(name)
+
+    def openTransaction(self, label):
+        self.transactions.append("open")
+
+    def commitTransaction(self):
+        self.transactions.append("commit")
+
+    def abortTransaction(self):
+        self.transactions.append("abort")
+
+    def recompute(self):
+        pass
+
+
+freecad_stub = types.ModuleType("FreeCAD")
+freecad_stub.ActiveDocument = None
+freecad_stub.Vector = lambda *args: args
+part_stub = types.ModuleType("Part")
+part_stub.makeCompound = lambda shapes: FakeShape("compound")
+sys.modules.setdefault("FreeCAD", freecad_stub)
+sys.modules.setdefault("Part", part_stub)
+
+import batch_operations as bo  # noqa: E402
+
+
+def fillet(name, source):
+    return {'name': name, 'operation': 'Fillet', 'sources': [source], 'radius': 1.0}
+
+
+def boxes(*names, failing=()):
+    return FakeDocument(FakeObject(n, FakeShape(n, fail=n in failing)) for n in names)
+
+
+def test_rejects_dependency_cycle():
+    doc = boxes("Box")
+    specs = [fillet("A", "B"), fillet("B", "A")]
+    with pytest.raises(ValueError, match="cycle"):
+        bo.build_dependency_graph(doc, specs)
+
+
+def test_rejects_unknown_source():
+    with pytest.raises(ValueError, match="Unknown source 'Missing'"):
+        bo.build_dependency_graph(boxes("Box"), [fillet("A", "Missing")])
+
+
+def test_rejects_name_already_in_document():
+    with pytest.raises(ValueError, match="Fillet is already used"):
+        bo.build_dependency_graph(boxes("Box", "Fillet"), [fillet("Fillet", "Box")])
+
+
+@pytest.mark.parametrize("spec, expected", [
+    ({'operation': 'Fillet', 'sources': ['Box'], 'radius': 1.0}, "missing: name"),
+    ({'name': 'A', 'sources': ['Box']}, "A is missing: operation"),
+    ({'name': 'A', 'operation': 'Fillet', 'sources': 'Box', 'radius': 1.0},
+     "must be a list, got str"),
+])
+def test_rejects_malformed_spec(spec, expected):
+    with pytest.raises(ValueError, match=expected):
+        bo.build_dependency_graph(boxes("Box"), [spec])
+
+
+def test_rejects_source_without_shape():
+    doc = FakeDocument([FakeObject("Sheet")])
+    with pytest.raises(ValueError, match="has no shape"):
+        bo.build_dependency_graph(doc, [fillet("A", "Sheet")])
+
+
+def test_rejects_missing_parameter():
+    spec = {'name': 'A', 'operation': 'Fillet', 'sources': ['Box']}
+    with pytest.raises(ValueError, match="missing: radius"):
+        bo.build_dependency_graph(boxes("Box"), [spec])
+
+
+@pytest.mark.parametrize("operation, sources, expected", [
+    ('Boolean Union', ['Box'], "at least 2"),
+    ('Extrude', ['Box', 'Other'], "exactly 1"),
+])
+def test_rejects_wrong_source_count(operation, sources, expected):
+    spec = {'name': 'A', 'operation': operation, 'sources': sources, 'vector': (0, 0, 1)}
+    with pytest.raises(ValueError, match=expected):
+        bo.build_dependency_graph(boxes("Box", "Other"), [spec])
+
+
+def test_order_follows_spec_list_within_dependencies():
+    specs = [fillet("Child", "Parent"), fillet("Other", "Box"), fillet("Parent", "Box")]
+    order = bo.build_dependency_graph(boxes("Box"), specs)[3]
+    assert order == ["Other", "Parent", "Child"]
+
+
+def test_requires_a_document():
+    with pytest.raises(ValueError, match="No document"):
+        bo.run_batch_operations([fillet("A", "Box")])
+
+
+def test_failure_skips_dependents_and_keeps_the_rest():
+    doc = boxes("Good", "Bad", failing=("Bad",))
+    specs = [
+        fillet("BadFillet", "Bad"),
+        fillet("GoodFillet", "Good"),
+        {'name': 'Pushed', 'operation': 'Extrude', 'sources': ['BadFillet'],
+         'vector': (0, 0, 1)},
+        {'name': 'Joined', 'operation': 'Boolean Union',
+         'sources': ['GoodFillet', 'Pushed']},
+    ]
+    report = bo.run_batch_operations(specs, doc=doc, max_workers=2)
+
+    assert list(report['created']) == ["GoodFillet"]
+    assert "fillet failed on Bad" in report['failed']["BadFillet"]
+    assert set(report['skipped']) == {"Pushed", "Joined"}
+    assert doc.added == ["GoodFillet"]
+    assert doc.transactions == ["open", "commit"]
+
+
+def test_unreadable_source_shape_fails_only_its_spec():
+    class BrokenShape(FakeShape):
+        def copy(self):
+            raise RuntimeError("null shape")
+
+    doc = FakeDocument([FakeObject("Box", FakeShape("Box")),
+                        FakeObject("Broken", BrokenShape("Broken"))])
+    report = bo.run_batch_operations(
+        [fillet("A", "Box"), fillet("B", "Broken"), fillet("C", "B")], doc=doc)
+
+    assert list(report['created']) == ["A"]
+    assert "null shape" in report['failed']["B"]
+    assert report['skipped'] == {"C": "Depends on failed operation B"}
+
+
+def test_long_failed_chain_does_not_recurse():
+    doc = boxes("Bad", failing=("Bad",))
+    specs = [fillet("Op0", "Bad")]
+    specs += [fillet(f"Op{i}", f"Op{i - 1}") for i in range(1, 1200)]
+    report = bo.run_batch_operations(specs, doc=doc)
+
+    assert list(report['failed']) == ["Op0"]
+    assert len(report['skipped']) == 1199
+
+
+def test_results_are_added_in_spec_order():
+    doc = boxes(*(f"Box{i}" for i in range(50)))
+    specs = [fillet(f"Fillet{i}", f"Box{i}") for i in range(50)]
+    bo.run_batch_operations(specs, doc=doc, max_workers=8)
+    assert doc.added == [spec['name'] for spec in specs]
+
+
+def test_failed_spec_is_not_also_skipped():
+    class BrokenShape(FakeShape):
+        def copy(self):
+            raise RuntimeError("null shape")
+
+    doc = FakeDocument([FakeObject("Broken", BrokenShape("Broken"))])
+    specs = [
+        fillet("A", "Broken"),
+        {'name': 'B', 'operation': 'Boolean Union', 'sources': ['A', 'Broken']},
+    ]
+    report = bo.run_batch_operations(specs, doc=doc)
+
+    assert set(report['failed']) == {"A", "B"}
+    assert report['skipped'] == {}
+
+
+def test_commit_failure_keeps_other_results():
+    class RejectingObject(FakeObject):
+        def __setattr__(self, key, value):
+            if key == "Shape" and self.Name == "BadAdd":
+                raise RuntimeError("cannot add")
+            super().__setattr__(key, value)
+
+    class RejectingDocument(FakeDocument):
+        def addObject(self, type_name, name):
+            obj = RejectingObject(name)
+            self.objects[name] = obj
+            self.added.append(name)
+            return obj
+
+    doc = RejectingDocument([FakeObject("Box", FakeShape("Box"))])
+    specs = [fillet("BadAdd", "Box"), fillet("Child", "BadAdd"), fillet("Good", "Box")]
+    report = bo.run_batch_operations(specs, doc=doc)
+
+    assert list(report['created']) == ["Good"]
+    assert "cannot add" in report['failed']["BadAdd"]
+    assert report['skipped'] == {"Child": "Depends on failed operation BadAdd"}
+    assert doc.added == ["Good"]
+    assert doc.transactions == ["open", "commit"]